@@ -3,16 +3,27 @@
 import pathlib
 import sys
 
+import orjson
+
 sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent / "tools"))
 
 
 class Resp:
     """Minimal stand-in for a requests.Response."""
 
-    def __init__(self, status=200, data=None, text=""):
+    def __init__(self, status=200, data=None, text="", headers=None):
         self.status_code = status
         self._data = {} if data is None else data
         self.text = text
+        self.headers = headers or {}
+
+    @property
+    def content(self):
+        return orjson.dumps(self._data)
 
     def json(self):
         return self._data
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
@@ -0,0 +1,140 @@
+"""Coverage report: GitHub pagination is mocked, no network."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import metrics
+import orjson
+from conftest import Resp
+
+
+def iso(days_ago):
+    ts = datetime.now(timezone.utc) - timedelta(days=days_ago)
+    return ts.strftime(metrics.TS_FORMAT)
+
+
+def pull(number, days_ago, merged=True, ref="main", title="t"):
+    return {
+        "number": number,
+        "updated_at": iso(days_ago),
+        "merged_at": iso(days_ago) if merged else None,
+        "head": {"ref": ref},
+        "title": title,
+        "body": None,
+        "html_url": f"https://gh/pr/{number}",
+    }
+
+
+def paged(pages):
+    """A session whose GET returns pages[page - 1], then empty pages."""
+    session = MagicMock()
+
+    def get(url, params, timeout):
+        index = params["page"] - 1
+        return Resp(200, pages[index] if index < len(pages) else [])
+
+    session.get.side_effect = get
+    return session
+
+
+def test_first_match_prefers_branch():
+    pattern = metrics.re.compile(metrics.DEFAULT_KEY_PATTERN)
+    pr = pull(1, 0, ref="feat/SECO-1-x", title="see SECO-2")
+    assert metrics.first_match(pattern, pr).group(0) == "SECO-1"
+    pr = pull(1, 0, title="no key")
+    assert metrics.first_match(pattern, pr) is None
+    pr["body"] = "fixes SECO-3"
+    assert metrics.first_match(pattern, pr).group(0) == "SECO-3"
+
+
+def test_fetch_pages_in_order_and_stops_on_short_page():
+    full = [pull(n, 0) for n in range(metrics.PER_PAGE)]
+    session = paged([full, full, [pull(999, 0)]])
+    batches = list(metrics.fetch_pages(session, "u", workers=4))
+    assert [len(b) for b in batches] == [100, 100, 1]
+
+
+def test_fetch_pages_waits_out_secondary_rate_limit(monkeypatch):
+    slept = []
+    monkeypatch.setattr(metrics.time, "sleep", slept.append)
+    session = MagicMock()
+    session.get.side_effect = [
+        Resp(403, {"message": "secondary rate limit"}, headers={"Retry-After": "7"}),
+        Resp(200, [pull(1, 0)]),
+    ]
+    batches = list(metrics.fetch_pages(session, "u", workers=4))
+    assert [len(b) for b in batches] == [1]
+    assert slept == [7.0]
+
+
+def test_fetch_pages_plain_403_is_not_retried(monkeypatch):
+    monkeypatch.setattr(metrics.time, "sleep", lambda s: None)
+    session = MagicMock()
+    session.get.return_value = Resp(403)
+    try:
+        list(metrics.fetch_pages(session, "u"))
+        raise AssertionError("expected the 403 to raise")
+    except RuntimeError:
+        pass
+    assert session.get.call_count == 1
+
+
+def test_main_failed_scan_leaves_no_partial_csv(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("GITHUB_TOKEN", "t")
+    monkeypatch.setenv("GITHUB_REPOSITORY", "o/r")
+    full = [pull(n, 0) for n in range(metrics.PER_PAGE)]
+    session = MagicMock()
+    session.get.side_effect = lambda url, params, timeout: (
+        Resp(200, full) if params["page"] == 1 else Resp(500)
+    )
+    monkeypatch.setattr(metrics.requests, "Session", lambda: session)
+
+    try:
+        metrics.main()
+        raise AssertionError("expected the 500 to raise")
+    except RuntimeError:
+        pass
+    assert not list((tmp_path / "metrics").iterdir())
+
+
+def test_write_atomic_failure_keeps_old_file_and_no_tmp(tmp_path):
+    target = tmp_path / "summary.json"
+    target.write_bytes(b"old")
+    try:
+        with metrics.write_atomic(target) as handle:
+            handle.write(b"partial")
+            raise OSError("disk full")
+    except OSError:
+        pass
+    assert target.read_bytes() == b"old"
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_main_writes_summary_and_csv(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("GITHUB_TOKEN", "t")
+    monkeypatch.setenv("GITHUB_REPOSITORY", "o/r")
+    monkeypatch.setenv("DAYS_BACK", "30")
+    # A blank workflow input falls back to the default.
+    monkeypatch.setenv("FETCH_WORKERS", "")
+    page = [
+        pull(1, 1, ref="feat/SECO-1-x"),
+        pull(2, 2),
+        pull(3, 3, merged=False),
+        pull(4, 40, ref="feat/SECO-4-x"),
+    ]
+    session = paged([page])
+    monkeypatch.setattr(metrics.requests, "Session", lambda: session)
+
+    assert metrics.main() == 0
+    summary = orjson.loads((tmp_path / "metrics" / "summary.json").read_bytes())
+    assert summary["merged_prs"] == 2
+    assert summary["traced_prs"] == 1
+    assert summary["coverage_pct"] == 50.0
+    lines = (tmp_path / "metrics" / "prs.csv").read_text().splitlines()
+    assert lines[0] == "number,merged_at,key,traced,url"
+    assert lines[1].startswith("1,") and ",SECO-1,True," in lines[1]
+    assert not list((tmp_path / "metrics").glob("*.tmp"))
+    # The stale PR ends the scan: no second page is requested.
+    assert session.get.call_count == 1
@@ -77,3 +77,12 @@ def test_draft_skips_transition(monkeypatch):
     assert sync.main() == 0
     t.link_pr.assert_called_once()
     t.transition.assert_not_called()
+
+
+def test_multiple_keys_each_processed(monkeypatch):
+    t = stub_tracker()
+    t.extract_keys.return_value = ["SECO-1", "SECO-2"]
+    t.issue_exists.side_effect = lambda key: key == "SECO-2"
+    wire(monkeypatch, t, make_pr("closed", merged=True))
+    assert sync.main() == 1
+    t.transition.assert_called_once_with("SECO-2", "done")
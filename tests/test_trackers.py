@@ -47,6 +47,22 @@ def test_jira_extract_filters_unknown_project(monkeypatch):
     ]
 
 
+def test_blank_project_keys_disable_filter():
+    from trackers.base import Tracker
+
+    t = Tracker({"project_keys": " , ", "key_pattern": ""})
+    assert not t.project_keys
+    assert t.extract_keys("feat/ANY-1-x") == ["ANY-1"]
+
+
+def test_jira_extract_dedupes_in_first_seen_order(monkeypatch):
+    t = jira(monkeypatch)
+    assert t.extract_keys("feat/SECO-2-x", "SECO-1 SECO-2", "SECO-1") == [
+        "SECO-2",
+        "SECO-1",
+    ]
+
+
 def test_jira_issue_exists(monkeypatch):
     t = jira(monkeypatch)
     t.session.get.return_value = Resp(200)
@@ -86,6 +102,20 @@ def test_jira_transition_done(monkeypatch):
     assert t.session.post.call_args[1]["json"] == {"transition": {"id": "31"}}
 
 
+def test_jira_transition_reuses_transitions_from_issue_check(monkeypatch):
+    monkeypatch.setenv("JIRA_TRANSITION_DONE", "Done")
+    t = jira(monkeypatch)
+    t.session.get.return_value = Resp(
+        200, {"key": "SECO-1", "transitions": [{"id": "31", "name": "Done"}]}
+    )
+    t.session.post.return_value = Resp(204)
+    assert t.issue_exists("SECO-1") is True
+    assert t.session.get.call_args[1]["params"]["expand"] == "transitions"
+    assert t.transition("SECO-1", "done") is True
+    assert t.session.get.call_count == 1
+    assert t.session.post.call_args[1]["json"] == {"transition": {"id": "31"}}
+
+
 def test_jira_transition_noop_when_unset(monkeypatch):
     t = jira(monkeypatch)
     assert t.transition("SECO-1", "done") is True
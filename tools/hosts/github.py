@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import os
 
+import orjson
 from trackers.base import PRContext
 
 from .base import resolve_event
@@ -19,8 +19,8 @@ def load() -> PRContext | None:
         logger.error("GITHUB_EVENT_PATH not set or missing")
         return None
     try:
-        with open(path, encoding="utf-8") as handle:
-            event = json.load(handle)
+        with open(path, "rb") as handle:
+            event = orjson.loads(handle.read())
     except Exception as exc:
         logger.error("failed to read event file: %s", exc)
         return None
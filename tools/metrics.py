@@ -2,25 +2,121 @@
 """Traceability coverage: share of merged PRs that reference an issue key.
 
 Writes metrics/summary.json and metrics/prs.csv. Needs GITHUB_TOKEN and
-GITHUB_REPOSITORY; KEY_PATTERN and DAYS_BACK optional.
+GITHUB_REPOSITORY; KEY_PATTERN, DAYS_BACK and FETCH_WORKERS optional.
 """
 
 from __future__ import annotations
 
 import csv
-import json
 import logging
 import os
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
 logger = logging.getLogger("traceability")
 
 DEFAULT_KEY_PATTERN = r"[A-Z][A-Z0-9]{1,9}-[0-9]+|AB#\d+|#\d+"
+PER_PAGE = 100
+TS_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+# prs.csv columns; rows are written as tuples in this order.
+CSV_FIELDS = ("number", "merged_at", "key", "traced", "url")
+# Retries of a page hit by a GitHub rate limit, each waiting at most this long.
+RATE_LIMIT_RETRIES = 2
+RATE_LIMIT_MAX_WAIT = 120.0
+
+
+def first_match(pattern: re.Pattern, pr: dict) -> re.Match | None:
+    """First key in the branch, else the first in the title or body.
+
+    Most keys are in the (short) branch name, so it is searched alone; the
+    miss path then costs one more search over title and body, not two.
+    """
+    match = pattern.search(pr.get("head", {}).get("ref", "") or "")
+    if match:
+        return match
+    return pattern.search(f"{pr.get('title') or ''}\n{pr.get('body') or ''}")
+
+
+@contextmanager
+def write_atomic(path: Path, mode: str = "wb", **kwargs):
+    """Yield a handle on a sibling .tmp file that replaces path on success.
+
+    Readers never see a half-written file; on error the .tmp is removed so
+    it cannot end up in the uploaded metrics artifact.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        with tmp.open(mode, **kwargs) as handle:
+            yield handle
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def rate_limit_wait(resp) -> float | None:
+    """Seconds to wait if resp is a GitHub rate-limit 403, else None.
+
+    Secondary limits come back as 403 with Retry-After, which urllib3's
+    Retry does not honour for 403; a spent primary limit has remaining 0.
+    """
+    if resp.status_code != 403:
+        return None
+    headers = resp.headers
+    if headers.get("Retry-After"):
+        wait = float(headers["Retry-After"])
+    elif headers.get("X-RateLimit-Remaining") == "0":
+        wait = float(headers.get("X-RateLimit-Reset") or 0) - time.time()
+    else:
+        return None
+    return min(max(wait, 1.0), RATE_LIMIT_MAX_WAIT)
+
+
+def fetch_pages(session, url: str, workers: int = 4):
+    """Pages of closed PRs, most recently updated first, in page order.
+
+    Page 1 is fetched alone (most windows end there); later pages are
+    fetched `workers` at a time. A caller that stops early wastes at most
+    workers - 1 requests.
+    """
+
+    def get(page: int) -> list:
+        params = {
+            "state": "closed",
+            "sort": "updated",
+            "direction": "desc",
+            "per_page": PER_PAGE,
+            "page": page,
+        }
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            resp = session.get(url, params=params, timeout=30)
+            wait = rate_limit_wait(resp)
+            if wait is None or attempt == RATE_LIMIT_RETRIES:
+                break
+            logger.warning("rate limited on page %s; retrying in %ss", page, wait)
+            time.sleep(wait)
+        resp.raise_for_status()
+        return orjson.loads(resp.content)
+
+    page, size = 1, 1
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        while True:
+            for batch in pool.map(get, range(page, page + size)):
+                yield batch
+                if len(batch) < PER_PAGE:
+                    return
+            page += size
+            size = workers
 
 
 def main() -> int:
@@ -28,12 +124,24 @@ def main() -> int:
     repo = os.environ.get("GITHUB_REPOSITORY", "")
     api = os.environ.get("GITHUB_API_URL", "https://api.github.com")
     days_back = int(os.environ.get("DAYS_BACK", "30"))
+    workers = max(1, int(os.environ.get("FETCH_WORKERS") or "4"))
     pattern = re.compile(os.environ.get("KEY_PATTERN") or DEFAULT_KEY_PATTERN)
     if not token or not repo:
         logger.error("GITHUB_TOKEN and GITHUB_REPOSITORY are required")
         return 1
 
     session = requests.Session()
+    # Keep one connection alive per fetch thread instead of re-handshaking,
+    # and retry transient failures rather than failing the whole report.
+    retry = Retry(
+        total=3,
+        backoff_factor=1.0,
+        status_forcelist=[429, 500, 502, 503, 504],
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(max_retries=retry, pool_maxsize=workers)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
     session.headers.update(
         {
             "Accept": "application/vnd.github+json",
@@ -42,60 +150,45 @@ def main() -> int:
         }
     )
 
+    # GitHub timestamps are fixed-width UTC ("2024-05-06T07:08:09Z"), so they
+    # order as strings; compare them to the cutoff without parsing.
     cutoff = datetime.now(timezone.utc) - timedelta(days=days_back)
-    rows, page = [], 1
-    while True:
-        resp = session.get(
-            f"{api}/repos/{repo}/pulls",
-            params={
-                "state": "closed",
-                "sort": "updated",
-                "direction": "desc",
-                "per_page": 100,
-                "page": page,
-            },
-            timeout=30,
-        )
-        resp.raise_for_status()
-        batch = resp.json()
-        if not batch:
-            break
-        stop = False
-        for pr in batch:
-            updated = datetime.fromisoformat(pr["updated_at"].replace("Z", "+00:00"))
-            if updated < cutoff:
-                stop = True
+    cutoff_ts = cutoff.strftime(TS_FORMAT)
+
+    out = Path("metrics")
+    out.mkdir(exist_ok=True)
+    total = traced = 0
+    # Rows stream to disk as PRs are scanned; no list or buffer of rows.
+    with write_atomic(out / "prs.csv", "w", newline="", encoding="utf-8") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(CSV_FIELDS)
+        for batch in fetch_pages(session, f"{api}/repos/{repo}/pulls", workers):
+            stop = False
+            for pr in batch:
+                if pr["updated_at"] < cutoff_ts:
+                    stop = True
+                    break
+                merged_at = pr.get("merged_at")
+                if not merged_at:
+                    continue
+                # Count by merge date, not by recent activity.
+                if merged_at < cutoff_ts:
+                    continue
+                match = first_match(pattern, pr)
+                total += 1
+                traced += bool(match)
+                writer.writerow(
+                    (
+                        pr["number"],
+                        merged_at,
+                        match.group(0) if match else "",
+                        bool(match),
+                        pr["html_url"],
+                    )
+                )
+            if stop:
                 break
-            merged_at = pr.get("merged_at")
-            if not merged_at:
-                continue
-            # Count by merge date, not by recent activity.
-            merged = datetime.fromisoformat(merged_at.replace("Z", "+00:00"))
-            if merged < cutoff:
-                continue
-            text = " ".join(
-                [
-                    pr.get("head", {}).get("ref", ""),
-                    pr.get("title", ""),
-                    pr.get("body") or "",
-                ]
-            )
-            match = pattern.search(text)
-            rows.append(
-                {
-                    "number": pr["number"],
-                    "merged_at": pr["merged_at"],
-                    "key": match.group(0) if match else "",
-                    "traced": bool(match),
-                    "url": pr["html_url"],
-                }
-            )
-        if stop or len(batch) < 100:
-            break
-        page += 1
-
-    total = len(rows)
-    traced = sum(1 for r in rows if r["traced"])
+
     # No merged PRs: report null, not a misleading 100%.
     coverage = round(100 * traced / total, 1) if total else None
     summary = {
@@ -106,15 +199,8 @@ def main() -> int:
         "coverage_pct": coverage,
     }
 
-    out = Path("metrics")
-    out.mkdir(exist_ok=True)
-    (out / "summary.json").write_text(json.dumps(summary, indent=2), encoding="utf-8")
-    with (out / "prs.csv").open("w", newline="", encoding="utf-8") as handle:
-        writer = csv.DictWriter(
-            handle, fieldnames=["number", "merged_at", "key", "traced", "url"]
-        )
-        writer.writeheader()
-        writer.writerows(rows)
+    with write_atomic(out / "summary.json") as handle:
+        handle.write(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
 
     if total:
         logger.info("coverage: %s%% (%s/%s)", coverage, traced, total)
@@ -10,9 +10,10 @@ from __future__ import annotations
 import logging
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 from hosts import detect_host, load_pr_context
-from trackers import available, get_tracker
+from trackers import PRContext, Tracker, available, get_tracker
 
 logging.basicConfig(
     level=logging.INFO,
@@ -21,11 +22,41 @@ logging.basicConfig(
 )
 logger = logging.getLogger("traceability")
 
+# Upper bound on keys handled at once for a PR that references several.
+MAX_WORKERS = 8
+
 
 def env_bool(name: str, default: bool = False) -> bool:
     return os.environ.get(name, str(default)).strip().lower() in ("1", "true", "yes")
 
 
+def process_key(tracker: Tracker, key: str, pr: PRContext, skip_draft: bool) -> int:
+    """Link, comment on, and transition one issue; 1 if it is missing."""
+    if not tracker.issue_exists(key):
+        print(f"::error::{tracker.name} issue {key} not found or inaccessible")
+        return 1
+
+    tracker.link_pr(key, pr)
+    logger.info("processing %s for PR #%s (%s)", key, pr.number, pr.action)
+
+    if pr.draft and skip_draft:
+        logger.info("draft PR; skipping comment and transition for %s", key)
+        return 0
+
+    if pr.action in ("opened", "reopened", "ready_for_review"):
+        verb = "ready for review" if pr.action == "ready_for_review" else "opened"
+        tracker.comment(key, f"Pull request {verb} by {pr.author}: {pr.html_url}")
+        tracker.transition(key, "in_review")
+    elif pr.action == "closed":
+        if pr.merged:
+            sha = pr.merge_commit_sha[:12]
+            tracker.comment(key, f"Pull request merged ({sha}): {pr.html_url}")
+            tracker.transition(key, "done")
+        else:
+            tracker.comment(key, f"Pull request closed unmerged: {pr.html_url}")
+    return 0
+
+
 def main() -> int:
     provider = os.environ.get("TRACKER_PROVIDER", "jira")
     config = {
@@ -55,33 +86,12 @@ def main() -> int:
         return 0
 
     skip_draft = env_bool("SKIP_DRAFT_PRS", False)
-    rc = 0
-    for key in keys:
-        if not tracker.issue_exists(key):
-            print(f"::error::{tracker.name} issue {key} not found or inaccessible")
-            rc = 1
-            continue
-
-        tracker.link_pr(key, pr)
-        logger.info("processing %s for PR #%s (%s)", key, pr.number, pr.action)
-
-        if pr.draft and skip_draft:
-            logger.info("draft PR; skipping comment and transition for %s", key)
-            continue
-
-        if pr.action in ("opened", "reopened", "ready_for_review"):
-            verb = "ready for review" if pr.action == "ready_for_review" else "opened"
-            tracker.comment(key, f"Pull request {verb} by {pr.author}: {pr.html_url}")
-            tracker.transition(key, "in_review")
-        elif pr.action == "closed":
-            if pr.merged:
-                sha = pr.merge_commit_sha[:12]
-                tracker.comment(key, f"Pull request merged ({sha}): {pr.html_url}")
-                tracker.transition(key, "done")
-            else:
-                tracker.comment(key, f"Pull request closed unmerged: {pr.html_url}")
-
-    return rc
+    if len(keys) == 1:
+        return process_key(tracker, keys[0], pr, skip_draft)
+    # Keys are independent issues: handle them concurrently, not in series.
+    with ThreadPoolExecutor(max_workers=min(len(keys), MAX_WORKERS)) as pool:
+        results = pool.map(lambda key: process_key(tracker, key, pr, skip_draft), keys)
+        return max(results)
 
 
 if __name__ == "__main__":
@@ -90,11 +90,12 @@ class Tracker:
 
     def __init__(self, config: dict):
         self.config = config or {}
-        self.project_keys = [
+        # A set: extract_keys checks every matched key's prefix against it.
+        self.project_keys = frozenset(
             k.strip()
             for k in (self.config.get("project_keys") or "").split(",")
             if k.strip()
-        ]
+        )
         self.key_pattern = self.config.get("key_pattern") or self.default_key_pattern
         self.timeout = int(self.config.get("timeout") or 15)
         self._key_rx = re.compile("(" + self.key_pattern + ")")
@@ -104,26 +105,23 @@ class Tracker:
     @staticmethod
     def _ordered_unique(items) -> list[str]:
         """De-duplicate while preserving first-seen order; drop falsy values."""
-        seen, out = set(), []
-        for item in items:
-            if item and item not in seen:
-                seen.add(item)
-                out.append(item)
-        return out
+        return list(dict.fromkeys(filter(None, items)))
 
     def extract_keys(self, *texts: str) -> list[str]:
-        keys = []
+        # One walk: the dict de-duplicates in first-seen order as keys arrive.
+        seen: dict[str, None] = {}
         for text in texts:
             for match in self._key_rx.finditer(text or ""):
                 key = match.group(1)
-                if (
-                    self.project_keys
-                    and "-" in key
-                    and key.split("-")[0] not in self.project_keys
-                ):
+                if not key or key in seen:
                     continue
-                keys.append(key)
-        return self._ordered_unique(keys)
+                if self.project_keys:
+                    # Project prefix by slice; no split() list per key.
+                    dash = key.find("-")
+                    if dash >= 0 and key[:dash] not in self.project_keys:
+                        continue
+                seen[key] = None
+        return list(seen)
 
     def state_for(self, target: str) -> str | None:
         return first_env(*self.target_envs.get(target, ()))
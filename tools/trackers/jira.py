@@ -33,14 +33,30 @@ class JiraTracker(Tracker):
         else:
             auth = (email, token)
         self.session = make_session(headers=headers, auth=auth)
+        # Transitions fetched alongside issue_exists, used once by transition().
+        self._transitions: dict = {}
 
     def _api(self, path: str) -> str:
         return f"{self.base_url}/rest/api/{self.api_version}/{path}"
 
     def issue_exists(self, key: str) -> bool:
+        # Only a minimal field set; the full issue can run to hundreds of KB.
+        params = {"fields": "summary"}
+        expand = any(self.state_for(target) for target in self.target_envs)
+        if expand:
+            # Saves transition() its own GET on the same issue.
+            params["expand"] = "transitions"
         try:
-            resp = self.session.get(self._api(f"issue/{key}"), timeout=self.timeout)
-            return resp.status_code == 200
+            resp = self.session.get(
+                self._api(f"issue/{key}"), params=params, timeout=self.timeout
+            )
+            if resp.status_code != 200:
+                return False
+            if expand:
+                transitions = resp.json().get("transitions")
+                if transitions is not None:
+                    self._transitions[key] = transitions
+            return True
         except Exception as exc:
             logger.error("verify %s failed: %s", key, exc)
             return False
@@ -99,11 +115,15 @@ class JiraTracker(Tracker):
             return True
         url = self._api(f"issue/{key}/transitions")
         try:
-            resp = self.session.get(url, timeout=self.timeout)
-            if resp.status_code != 200:
-                logger.warning("transitions for %s unavailable", key)
-                return False
-            for trans in resp.json().get("transitions", []):
+            # Popped: once the issue moves, its transitions change.
+            transitions = self._transitions.pop(key, None)
+            if transitions is None:
+                resp = self.session.get(url, timeout=self.timeout)
+                if resp.status_code != 200:
+                    logger.warning("transitions for %s unavailable", key)
+                    return False
+                transitions = resp.json().get("transitions", [])
+            for trans in transitions:
                 if str(trans["id"]) == str(wanted) or (
                     trans["name"].lower() == str(wanted).lower()
                 ):